@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Callable
 
-@dataclass
+@dataclass(slots=True)
 class CallbackConfig:
     """
     Holds all necessary information about a logging callback method
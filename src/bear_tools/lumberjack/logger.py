@@ -5,7 +5,6 @@ import inspect
 import io
 from pathlib import Path
 import sys
-import time
 from typing import Callable, TextIO
 
 from bear_tools.lumberjack import CallbackConfig, LogLevel, print_color, PrintColor
@@ -214,7 +213,7 @@ class Logger:
             log_label: str = level.name.capitalize()
 
             if self.add_timestamps:
-                timestamp = datetime.datetime.fromtimestamp(time.time()).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+                timestamp = datetime.datetime.now().isoformat(sep=' ', timespec='milliseconds')
 
             if self.add_caller:
                 stack:       list[inspect.FrameInfo] = inspect.stack()
@@ -260,14 +259,12 @@ class Logger:
                         _f.write(f'{full_msg}\n')
 
             # Send logs to any registered subscribers
-            for _callback_log_level, _callbacks in self.__callbacks.items():
-                if _callback_log_level == level:
-                    for _config in _callbacks:
-                        _message: str = (
-                            f'{signature}'
-                            f'[{timestamp}]' if _config.add_timestamps else ''
-                            f' {caller}' if _config.add_caller else ''
-                            f' {text}'
-                        )
-                        _config.callback(_message)
+            for _config in self.__callbacks.get(level, []):
+                _message: str = (
+                    f'{signature}'
+                    f'[{timestamp}]' if _config.add_timestamps else ''
+                    f' {caller}' if _config.add_caller else ''
+                    f' {text}'
+                )
+                _config.callback(_message)
 
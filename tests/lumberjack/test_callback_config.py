@@ -12,3 +12,9 @@ def test_CallbackConfig() -> None:
             except:
                 pytest.fail()
 
+
+def test_CallbackConfig_slots() -> None:
+    config = CallbackConfig(callback=print, add_timestamps=True, add_caller=True)
+    assert not hasattr(config, '__dict__')
+    with pytest.raises(AttributeError):
+        config.unknown_field = True  # type: ignore
@@ -1,3 +1,4 @@
+import itertools
 from bear_tools.lumberjack import LogLevel
 
 def test_LogLevel() -> None:
@@ -6,18 +7,11 @@ def test_LogLevel() -> None:
         assert isinstance(_enum.value, int), f'LogLevel contains non-int value: {_enum} (value: {_enum.value})'
     
     # Subtest: Make sure comparison operators are working as expected
-    subtests = {
-        LogLevel.NOISE:   [LogLevel.DEBUG,   LogLevel.INFO,    LogLevel.WARNING, LogLevel.ERROR],
-        LogLevel.DEBUG:   [LogLevel.INFO,    LogLevel.WARNING, LogLevel.ERROR],
-        LogLevel.INFO:    [LogLevel.WARNING, LogLevel.ERROR],
-        LogLevel.WARNING: [LogLevel.ERROR],
-    }
-
-    for log_level, higher_log_levels in subtests.items():
-        for higher_log_level in higher_log_levels:
-            assert log_level < higher_log_level
-            assert log_level <= higher_log_level
-            assert higher_log_level > log_level
-            assert higher_log_level >= log_level
-            assert log_level != higher_log_level
-
+    ordered = [LogLevel.NOISE, LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR]
+    assert ordered == sorted(ordered)
+    for log_level, higher_log_level in itertools.combinations(ordered, 2):
+        assert log_level < higher_log_level
+        assert log_level <= higher_log_level
+        assert higher_log_level > log_level
+        assert higher_log_level >= log_level
+        assert log_level != higher_log_level
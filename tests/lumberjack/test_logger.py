@@ -1,21 +1,60 @@
 import itertools
+from pathlib import Path
 import pytest
 from bear_tools.lumberjack import Logger, LogLevel, PrintColor
 
 test_text: str = 'test'
 test_symbols: list[str] = ['.', '..', '...']
+color_pairs: tuple[tuple[PrintColor, str], ...] = tuple((_color, _color.value) for _color in PrintColor)
+color_ids: list[str] = [_color.name for _color, _ in color_pairs]
+banner_params: tuple[tuple[PrintColor, str, str], ...] = tuple(
+    (_color, _color_value, _symbol) for (_color, _color_value), _symbol in itertools.product(color_pairs, test_symbols)
+)
+banner_ids: list[str] = [f'{_color.name}-{_symbol}' for _color, _, _symbol in banner_params]
+api_names: dict[LogLevel, str] = {_log_level: _log_level.name.lower() for _log_level in LogLevel}
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """
+    Parametrize test_Logger_register_and_unregister_callback over every LogLevel/add_timestamps/add_caller combination
+    """
+
+    if metafunc.definition.name == 'test_Logger_register_and_unregister_callback':
+        metafunc.parametrize(
+            'log_level, add_timestamps, add_caller',
+            ((_log_level, _add_timestamps, _add_caller)
+             for _log_level in LogLevel for _add_timestamps in (True, False) for _add_caller in (True, False))
+        )
+
+
+@pytest.fixture
+def temp_log_path(tmp_path: Path) -> Path:
+    """
+    Path to a (not yet created) log file inside pytest's per-test temporary directory
+    """
+
+    return tmp_path / 'log.txt'
+
+
+@pytest.fixture(scope='module')
+def logger() -> Logger:
+    """
+    Default Logger shared by tests that only call the logging APIs and do not reconfigure it
+    """
+
+    return Logger()
 
 
 def test_Logger_log_level_basic() -> None:
     """
-    Verify that loggers can be instantiated at all log levels
+    Verify that a logger's log level can be set at construction time and then changed to every other log level
     """
 
+    logger = Logger(LogLevel.NOISE)
+    assert logger.log_level == LogLevel.NOISE, f'Expected log level: {LogLevel.NOISE}, actual: {logger.log_level}'
+
     for _log_level in LogLevel:
-        try:
-            logger = Logger(_log_level)
-        except:
-            pytest.fail(f'Failed to instantiate Logger with log level: {_log_level}')
+        logger.log_level = _log_level
         assert logger.log_level == _log_level, f'Expected log level: {_log_level}, actual: {logger.log_level}'
 
 
@@ -41,104 +80,87 @@ def test_Logger_set_log_level() -> None:
         assert logger.log_level == expected, f'Expected log level: {expected}, actual: {logger.log_level}'
 
 
-def test_Logger_banner() -> None:
+def test_Logger_output_paths_file(temp_log_path: Path) -> None:
+    """
+    Verify that logs are appended to files given as output paths
+    """
+
+    logger = Logger(output_paths=[temp_log_path])
+    logger.info(text=test_text)
+    logger.debug(text='not logged')
+    logger.warning(text=test_text)
+
+    lines: list[str] = temp_log_path.read_text().splitlines()
+    assert len(lines) == 2, f'Expected 2 lines in log file, actual: {lines}'
+    for _line in lines:
+        assert _line.endswith(f': {test_text}'), f'Unexpected log line: "{_line}"'
+
+
+@pytest.mark.parametrize('color, color_value, symbol', banner_params, ids=banner_ids)
+def test_Logger_banner(logger: Logger, color: PrintColor, color_value: str, symbol: str) -> None:
     """
     Verify that there are no problems calling the banner API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.banner(text=test_text, color=_color, symbol=_symbol)
-                logger.banner(text=test_text, color=_color.value, symbol=_symbol)
-            except:
-                pytest.fail(f'Failed to log banner with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
+    logger.banner(text=test_text, color=color, symbol=symbol)
+    logger.banner(text=test_text, color=color_value, symbol=symbol)
 
 
-def test_Logger_noise() -> None:
+@pytest.mark.parametrize('color, color_value', color_pairs, ids=color_ids)
+def test_Logger_noise(logger: Logger, color: PrintColor, color_value: str) -> None:
     """
     Verify that there are no problems calling the noise API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.noise(text=test_text, color=None)
-                logger.noise(text=test_text, color=_color)
-                logger.noise(text=test_text, color=_color.value)
-            except:
-                pytest.fail(f'Failed to log noise with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
+    logger.noise(text=test_text, color=None)
+    logger.noise(text=test_text, color=color)
+    logger.noise(text=test_text, color=color_value)
 
 
-def test_Logger_debug() -> None:
+@pytest.mark.parametrize('color, color_value', color_pairs, ids=color_ids)
+def test_Logger_debug(logger: Logger, color: PrintColor, color_value: str) -> None:
     """
     Verify that there are no problems calling the debug API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.debug(text=test_text, color=None)
-                logger.debug(text=test_text, color=_color)
-                logger.debug(text=test_text, color=_color.value)
-            except:
-                pytest.fail(f'Failed to log debug with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
+    logger.debug(text=test_text, color=None)
+    logger.debug(text=test_text, color=color)
+    logger.debug(text=test_text, color=color_value)
 
 
-def test_Logger_info() -> None:
+@pytest.mark.parametrize('color, color_value', color_pairs, ids=color_ids)
+def test_Logger_info(logger: Logger, color: PrintColor, color_value: str) -> None:
     """
     Verify that there are no problems calling the info API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.info(text=test_text, color=None)
-                logger.info(text=test_text, color=_color)
-                logger.info(text=test_text, color=_color.value)
-            except:
-                pytest.fail(f'Failed to log info with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
+    logger.info(text=test_text, color=None)
+    logger.info(text=test_text, color=color)
+    logger.info(text=test_text, color=color_value)
 
 
-def test_Logger_warning() -> None:
+@pytest.mark.parametrize('color, color_value', color_pairs, ids=color_ids)
+def test_Logger_warning(logger: Logger, color: PrintColor, color_value: str) -> None:
     """
     Verify that there are no problems calling the warning API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.warning(text=test_text, color=None)
-                logger.warning(text=test_text, color=_color)
-                logger.warning(text=test_text, color=_color.value)
-            except:
-                pytest.fail(f'Failed to log warning with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
+    logger.warning(text=test_text, color=None)
+    logger.warning(text=test_text, color=color)
+    logger.warning(text=test_text, color=color_value)
 
 
-def test_Logger_error() -> None:
+@pytest.mark.parametrize('color, color_value', color_pairs, ids=color_ids)
+def test_Logger_error(logger: Logger, color: PrintColor, color_value: str) -> None:
     """
     Verify that there are no problems calling the error API
     """
 
-    logger = Logger()
-    for _color in PrintColor:
-        for _symbol in test_symbols:
-            try:
-                logger.error(text=test_text, color=None)
-                logger.error(text=test_text, color=_color)
-                logger.error(text=test_text, color=_color.value)
-            except:
-                pytest.fail(f'Failed to log error with text: "{test_text}", color: {_color}, symbol: "{_symbol}"')
-
-
-@pytest.mark.parametrize('log_level, add_timestamps, add_caller', list(itertools.product(
-    list(LogLevel), (True, False), (True, False)
-)))
+    logger.error(text=test_text, color=None)
+    logger.error(text=test_text, color=color)
+    logger.error(text=test_text, color=color_value)
+
+
 def test_Logger_register_and_unregister_callback(log_level: LogLevel, add_timestamps: bool, add_caller: bool) -> None:
     """
     Verify that callbacks registered at specific levels get called
@@ -154,7 +176,7 @@ def test_Logger_register_and_unregister_callback(log_level: LogLevel, add_timest
     logger.register_callback(log_level, callback, add_timestamps, add_caller)
     callback_data: dict = {}
     if log_level != LogLevel.SILENT:
-        api_name = str(log_level.name).lower()
+        api_name = api_names[log_level]
         api = getattr(logger, api_name)
         api(f'Calling logger.{api_name}')  # This should trigger the callback
         callback_triggered: bool = callback_data.get('value', False)
@@ -165,9 +187,38 @@ def test_Logger_register_and_unregister_callback(log_level: LogLevel, add_timest
 
     # Verify that the callback is not triggered when not registered
     if log_level != LogLevel.SILENT:
-        api_name = str(log_level.name).lower()
+        api_name = api_names[log_level]
         api = getattr(logger, api_name)
         api(f'Calling logger.{api_name}')  # This should trigger the callback
         callback_triggered: bool = callback_data.get('value', False)
         assert not callback_triggered, f'logger.{api_name} triggered the callback after unregistering'
 
+
+
+def test_Logger_callback_dispatch_scaling() -> None:
+    """
+    Verify that every one of many callbacks registered at a level is called exactly once per log
+    """
+
+    num_callbacks: int = 100
+    call_counts: list[int] = [0] * num_callbacks
+
+    def make_callback(index: int):
+        def callback(text: str) -> None:
+            call_counts[index] += 1
+        return callback
+
+    callbacks = [make_callback(_i) for _i in range(num_callbacks)]
+    logger = Logger()
+    for _callback in callbacks:
+        logger.register_callback(LogLevel.INFO, _callback)
+        logger.register_callback(LogLevel.ERROR, _callback)
+
+    logger.info(test_text)
+    assert call_counts == [1] * num_callbacks, f'Unexpected callback call counts: {call_counts}'
+
+    for _callback in callbacks:
+        logger.unregister_callback(LogLevel.INFO, _callback)
+
+    logger.info(test_text)
+    assert call_counts == [1] * num_callbacks, f'Callbacks triggered after unregistering: {call_counts}'